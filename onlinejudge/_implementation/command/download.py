@@ -1,4 +1,5 @@
 # Python Version: 3.x
+import concurrent.futures
 import json
 import os
 import pathlib
@@ -37,10 +38,12 @@ def download(args: 'argparse.Namespace') -> None:
         args.format = '%b.%e'
 
     # get samples from the server
-    with utils.with_cookiejar(utils.new_session_with_our_user_agent(), path=args.cookie) as sess:
+    with utils.session(path=args.cookie) as sess:
         if args.system:
-            samples = problem.download_system_cases(session=sess)  # type: ignore
+            samples = problem.download_system_cases(session=sess, jobs=args.jobs or 1)  # type: ignore
         else:
+            if args.jobs is not None:
+                log.warning('--jobs is supported only with --system')
             samples = problem.download_sample_cases(session=sess)  # type: ignore
 
     # append the history for submit command
@@ -49,35 +52,64 @@ def download(args: 'argparse.Namespace') -> None:
         history.add(problem)
 
     # write samples to files
-    for i, sample in enumerate(samples):
-        log.emit('')
-        log.info('sample %d', i)
+    # the file I/O is independent for each sample, so the writes run in a thread pool; the log records are collected and emitted in order afterwards, batching consecutive plain lines into a single logging call
+    render_format = format_utils.compile_percentformat(args.format)
+    seen_dirs = set()  # type: Set[pathlib.Path]  # updated from the workers; a lost update only costs one extra mkdir with exist_ok=True
+
+    def write_sample(i: int, sample: onlinejudge.type.TestCase) -> List[Tuple[Callable[..., None], str]]:
+        records = []  # type: List[Tuple[Callable[..., None], str]]
+        records += [(log.emit, '')]
+        records += [(log.emit, log.prefix['info'] + 'sample %d' % i)]
+        name = sample.name
+        table = {}
+        table['i'] = str(i + 1)
+        table['n'] = name
+        table['b'] = os.path.basename(name)
+        table['d'] = os.path.dirname(name)
         for ext in ['in', 'out']:
             data = getattr(sample, ext + 'put_data')
             if data is None:
                 continue
-            name = sample.name
-            table = {}
-            table['i'] = str(i + 1)
             table['e'] = ext
-            table['n'] = name
-            table['b'] = os.path.basename(name)
-            table['d'] = os.path.dirname(name)
-            path = args.directory / format_utils.percentformat(args.format, table)  # type: pathlib.Path
-            log.status('%sput: %s', ext, name)
+            path = args.directory / render_format(table)  # type: pathlib.Path
+            records += [(log.emit, log.prefix['status'] + '%sput: %s' % (ext, name))]
             if not args.silent:
-                log.emit(utils.snip_large_file_content(data, limit=40, head=20, tail=10, bold=True))
+                records += [(log.emit, utils.snip_large_file_content(data, limit=40, head=20, tail=10, bold=True))]
             if args.dry_run:
                 continue
-            if path.exists():
-                log.warning('file already exists: %s', path)
-                if not args.overwrite:
-                    log.warning('skipped')
-                    continue
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open('wb') as fh:
+            if not args.overwrite and path.exists():
+                records += [(log.warning, 'file already exists: %s' % path)]
+                records += [(log.warning, 'skipped')]
+                continue
+            if path.parent not in seen_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                seen_dirs.add(path.parent)
+            # write to a temporary file and rename it atomically, so that an interrupted download cannot leave a partial file which later runs without --overwrite would skip
+            tmp_path = path.parent / (path.name + '.tmp')
+            with tmp_path.open('wb', buffering=1 << 20) as fh:
                 fh.write(data)
-            log.success('saved to: %s', path)
+            os.replace(str(tmp_path), str(path))
+            records += [(log.success, 'saved to: %s' % path)]
+        return records
+
+    def emit_records(records: List[Tuple[Callable[..., None], str]]) -> None:
+        buffered = []  # type: List[str]
+        for emit, message in records:
+            if emit is log.emit:
+                buffered += [message]
+            else:  # warnings and successes keep their own log level
+                if buffered:
+                    log.emit('\n'.join(buffered))
+                    buffered = []
+                emit(message)
+        if buffered:
+            log.emit('\n'.join(buffered))
+
+    if samples:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(samples))) as executor:
+            futures = [executor.submit(write_sample, i, sample) for i, sample in enumerate(samples)]
+        for future in futures:
+            emit_records(future.result())
 
     # print json
     if args.json:
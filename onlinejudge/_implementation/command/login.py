@@ -86,7 +86,7 @@ def login(args: 'argparse.Namespace') -> None:
     if service is None:
         sys.exit(1)
 
-    with utils.with_cookiejar(utils.new_session_with_our_user_agent(), path=args.cookie) as session:
+    with utils.session(path=args.cookie) as session:
 
         if is_logged_in_with_message(service, session=session):
             return
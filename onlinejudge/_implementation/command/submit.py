@@ -39,7 +39,7 @@ def submit(args: 'argparse.Namespace') -> None:
         sys.exit(1)
 
     # read code
-    with args.file.open('rb') as fh:
+    with args.file.open('rb', buffering=1 << 20) as fh:
         code = fh.read()  # type: bytes
     format_config = {
         'dos2unix': args.format_dos2unix or args.golf,
@@ -49,11 +49,16 @@ def submit(args: 'argparse.Namespace') -> None:
 
     # report code
     log.info('code (%d byte):', len(code))
-    log.emit(utils.snip_large_file_content(code, limit=30, head=10, tail=10, bold=True))
+    if log.logger.isEnabledFor(log.logging.INFO):  # the decode of the whole code is skipped when nobody reads it
+        log.emit(utils.snip_large_file_content(code, limit=30, head=10, tail=10, bold=True))
 
-    with utils.with_cookiejar(utils.new_session_with_our_user_agent(), path=args.cookie) as sess:
+    with utils.session(path=args.cookie) as sess:
         # guess or select language ids
-        langs = {language.id: {'description': language.name} for language in problem.get_available_languages(session=sess)}  # type: Dict[LanguageId, Dict[str, str]]
+        if args.no_language_cache:
+            languages = problem.get_available_languages(session=sess)
+        else:
+            languages = utils.get_cached_available_languages(problem, session=sess)
+        langs = {language.id: {'description': language.name} for language in languages}  # type: Dict[LanguageId, Dict[str, str]]
         matched_lang_ids = None  # type: Optional[List[str]]
         if args.language in langs:
             matched_lang_ids = [args.language]
@@ -137,6 +142,7 @@ def submit(args: 'argparse.Namespace') -> None:
             sys.exit(1)
         except SubmissionError:
             log.failure('submission failed')
+            utils.discard_cached_available_languages(problem)  # the cached language id may be outdated
             sys.exit(1)
 
         # show result
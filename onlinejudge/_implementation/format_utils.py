@@ -5,7 +5,7 @@ import os
 import pathlib
 import re
 import sys
-from typing import Dict, Generator, List, Match, Optional, Set
+from typing import Callable, Dict, Generator, List, Match, Optional, Set, Tuple
 
 import onlinejudge._implementation.logging as log
 
@@ -15,16 +15,34 @@ def percentsplit(s: str) -> Generator[str, None, None]:
         yield m.group(0)
 
 
-def percentformat(s: str, table: Dict[str, str]) -> str:
-    assert '%' not in table or table['%'] == '%'
-    table['%'] = '%'
-    result = ''
+def compile_percentformat(s: str) -> Callable[[Dict[str, str]], str]:
+    """
+    :note: use this when the same format string is applied to many tables, so that the format string is tokenized only once
+    """
+
+    tokens = []  # type: List[Tuple[bool, str]]  # the pairs (is_key, value)
+    literal = ''
     for c in percentsplit(s):
         if c.startswith('%'):
-            result += table[c[1]]
+            if literal:
+                tokens += [(False, literal)]
+                literal = ''
+            tokens += [(True, c[1])]
         else:
-            result += c
-    return result
+            literal += c
+    if literal:
+        tokens += [(False, literal)]
+
+    def render(table: Dict[str, str]) -> str:
+        assert '%' not in table or table['%'] == '%'
+        table['%'] = '%'
+        return ''.join(table[value] if is_key else value for is_key, value in tokens)
+
+    return render
+
+
+def percentformat(s: str, table: Dict[str, str]) -> str:
+    return compile_percentformat(s)(table)
 
 
 def percentparse(s: str, format: str, table: Dict[str, str]) -> Optional[Dict[str, str]]:
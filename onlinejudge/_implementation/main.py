@@ -1,6 +1,7 @@
 # Python Version: 3.x
 # -*- coding: utf-8 -*-
 import argparse
+import importlib
 import pathlib
 import sys
 import traceback
@@ -12,14 +13,6 @@ import onlinejudge
 import onlinejudge.__about__ as version
 import onlinejudge._implementation.logging as log
 import onlinejudge._implementation.utils as utils
-from onlinejudge._implementation.command.download import download
-from onlinejudge._implementation.command.generate_input import generate_input
-from onlinejudge._implementation.command.generate_output import generate_output
-from onlinejudge._implementation.command.login import login
-from onlinejudge._implementation.command.split_input import split_input, split_input_auto_footer
-from onlinejudge._implementation.command.submit import submit
-from onlinejudge._implementation.command.test import test
-from onlinejudge._implementation.command.test_reactive import test_reactive
 
 
 def version_check() -> None:
@@ -29,14 +22,7 @@ def version_check() -> None:
         log.info('see: https://github.com/kmyk/online-judge-tools/blob/master/CHANGELOG.md')
 
 
-def get_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description='Tools for online judge services')
-    parser.add_argument('-v', '--verbose', action='store_true')
-    parser.add_argument('-c', '--cookie', type=pathlib.Path, default=utils.default_cookie_path, help='path to cookie. (default: {})'.format(utils.default_cookie_path))
-    parser.add_argument('--version', action='store_true', help='print the online-judge-tools version number')
-    subparsers = parser.add_subparsers(dest='subcommand', help='for details, see "{} COMMAND --help"'.format(sys.argv[0]))
-
-    # download
+def add_subparser_download(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('download', aliases=['d', 'dl'], help='download sample cases', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 supported services:
   Anarchy Golf
@@ -71,10 +57,12 @@ format string for --format:
     subparser.add_argument('--overwrite', action='store_true')
     subparser.add_argument('-n', '--dry-run', action='store_true', help='don\'t write to files')
     subparser.add_argument('-a', '--system', action='store_true', help='download system testcases')
+    subparser.add_argument('-j', '--jobs', metavar='N', type=int, help='specifies the number of parallel HTTP requests, for services which download each test case separately  (default: no parallelization)')
     subparser.add_argument('-s', '--silent', action='store_true')
     subparser.add_argument('--json', action='store_true')
 
-    # login
+
+def add_subparser_login(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('login', aliases=['l'], help='login to a service', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 supported services:
   AtCoder
@@ -90,7 +78,8 @@ supported services:
     subparser.add_argument('--check', action='store_true', help='check whether you are logged in or not')
     subparser.add_argument('--use-browser', choices=('always', 'auto', 'never'), default='auto', help='specify whether it uses a GUI web browser to login or not  (default: auto)')
 
-    # submit
+
+def add_subparser_submit(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('submit', aliases=['s'], help='submit your solution', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 supported services:
   AtCoder
@@ -104,6 +93,7 @@ supported services:
     subparser.add_argument('url', nargs='?', help='the URL of the problem to submit. if not given, guessed from history of download command.')
     subparser.add_argument('file', type=pathlib.Path)
     subparser.add_argument('-l', '--language', help='narrow down language choices if ambiguous')
+    subparser.add_argument('--no-language-cache', action='store_true', help='get the list of available languages from the server even if it is cached')
     subparser.add_argument('--no-guess', action='store_false', dest='guess')
     subparser.add_argument('-g', '--guess', action='store_true', help='guess the language for your file (default)')
     subparser.add_argument('--no-guess-latest', action='store_false', dest='guess_cxx_latest')
@@ -120,7 +110,8 @@ supported services:
     subparser.add_argument('-y', '--yes', action='store_true', help='don\'t confirm')
     subparser.add_argument('--full-submission', action='store_true', help='for Topcoder Marathon Match. use this to do "Submit", the default behavier is "Test Examples".')
 
-    # test
+
+def add_subparser_test(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('test', aliases=['t'], help='test your code', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 format string for --format:
   %s                    name
@@ -150,7 +141,8 @@ tips:
     subparser.add_argument('--json', action='store_true')
     subparser.add_argument('test', nargs='*', type=pathlib.Path, help='paths of test cases. (if empty: globbed from --format)')
 
-    # generate output
+
+def add_subparser_generate_output(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('generate-output', aliases=['g/o'], help='generate output files form input and reference implementation', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 format string for --format:
   %s                    name
@@ -169,7 +161,8 @@ tips:
     subparser.add_argument('--no-ignore-backup', action='store_false', dest='ignore_backup')
     subparser.add_argument('--ignore-backup', action='store_true', help='ignore backup files and hidden files (i.e. files like "*~", "\\#*\\#" and ".*") (default)')
 
-    # generate input
+
+def add_subparser_generate_input(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('generate-input', aliases=['g/i'], help='generate input files form given generator', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 format string for --format:
   %s                    name
@@ -190,7 +183,8 @@ tips:
     subparser.add_argument('generator', type=str, help='your program to generate test cases')
     subparser.add_argument('count', nargs='?', type=int, help='the number of cases to generate (default: 100)')
 
-    # split input
+
+def add_subparser_split_input(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('split-input', help='split a input file which contains many cases, using your implementation  (experimental)', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 format string for --output:
   %i                    index
@@ -248,14 +242,47 @@ example:
     subparser.add_argument('--ignore', metavar='N', default=0, type=int, help='ignore initial N lines of input')
     subparser.add_argument('--header', help='put a header string to the output')
     subparser.add_argument('--footer', help='put a footer string to the output')
+    from onlinejudge._implementation.command.split_input import split_input_auto_footer
     subparser.add_argument('--auto-footer', action='store_const', const=split_input_auto_footer, dest='footer', help='use the original last line as a footer')
 
-    # test reactive
+
+def add_subparser_test_reactive(subparsers: argparse._SubParsersAction) -> None:
     subparser = subparsers.add_parser('test-reactive', aliases=['t/r'], help='test for reactive problem', formatter_class=argparse.RawTextHelpFormatter, epilog='''\
 ''')
     subparser.add_argument('-c', '--command', default='./a.out', help='your solution to be tested. (default: "./a.out")')
     subparser.add_argument('judge', help='judge program using standard I/O')
 
+
+subcommands = [
+    # (aliases, subparser builder, handler name); the handler `foo` is the function `foo` in the module onlinejudge._implementation.command.foo, imported lazily in run_program() since each invocation uses only one of the command modules
+    (['download', 'd', 'dl'], add_subparser_download, 'download'),
+    (['login', 'l'], add_subparser_login, 'login'),
+    (['submit', 's'], add_subparser_submit, 'submit'),
+    (['test', 't'], add_subparser_test, 'test'),
+    (['generate-output', 'g/o'], add_subparser_generate_output, 'generate_output'),
+    (['generate-input', 'g/i'], add_subparser_generate_input, 'generate_input'),
+    (['split-input'], add_subparser_split_input, 'split_input'),
+    (['test-reactive', 't/r'], add_subparser_test_reactive, 'test_reactive'),
+]
+
+subcommand_aliases = frozenset(alias for aliases, _, _ in subcommands for alias in aliases)
+subcommand_dispatch = {alias: name for aliases, _, name in subcommands for alias in aliases}
+
+
+def get_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    :param command: builds only the subparser for the given subcommand, to skip constructing the unused ones
+
+    :note: building the whole tree of subparsers (and their long epilogs) dominates the startup time of short commands, so main() builds only the required subparser when the subcommand is already known from argv. A pickle-based cache doesn't work here since argparse parsers hold unpicklable local functions in their registries.
+    """
+    parser = argparse.ArgumentParser(description='Tools for online judge services')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    parser.add_argument('-c', '--cookie', type=pathlib.Path, default=utils.default_cookie_path, help='path to cookie. (default: {})'.format(utils.default_cookie_path))
+    parser.add_argument('--version', action='store_true', help='print the online-judge-tools version number')
+    subparsers = parser.add_subparsers(dest='subcommand', help='for details, see "{} COMMAND --help"'.format(sys.argv[0]))
+    for aliases, builder, _ in subcommands:
+        if command is None or command in aliases:
+            builder(subparsers)
     return parser
 
 
@@ -267,32 +294,21 @@ def run_program(args: argparse.Namespace, parser: argparse.ArgumentParser) -> No
         log.setLevel(log.logging.DEBUG)
     log.debug('args: %s', str(args))
 
-    if args.subcommand in ['download', 'd', 'dl']:
-        download(args)
-    elif args.subcommand in ['login', 'l']:
-        login(args)
-    elif args.subcommand in ['submit', 's']:
-        submit(args)
-    elif args.subcommand in ['test', 't']:
-        test(args)
-    elif args.subcommand in ['test-reactive', 't/r']:
-        test_reactive(args)
-    elif args.subcommand in ['generate-output', 'g/o']:
-        generate_output(args)
-    elif args.subcommand in ['generate-input', 'g/i']:
-        generate_input(args)
-    elif args.subcommand == 'split-input':
-        split_input(args)
-    else:
+    name = subcommand_dispatch.get(args.subcommand)
+    if name is None:
         parser.print_help(file=sys.stderr)
         sys.exit(1)
+    handler = getattr(importlib.import_module('onlinejudge._implementation.command.' + name), name)
+    handler(args)
 
 
 def main(args: Optional[List[str]] = None) -> None:
     log.addHandler(log.logging.StreamHandler(sys.stderr))
     log.setLevel(log.logging.INFO)
     version_check()
-    parser = get_parser()
+    argv = sys.argv[1:] if args is None else args
+    command = argv[0] if argv and argv[0] in subcommand_aliases else None
+    parser = get_parser(command)
     namespace = parser.parse_args(args=args)
     try:
         run_program(namespace, parser=parser)
@@ -63,9 +63,12 @@ def extract_from_files(files: Iterator[Tuple[str, bytes]], format: str = '%s.%e'
     return testcases
 
 
-def extract_from_zip(zip_data: bytes, format: str, out: str = 'out') -> List[TestCase]:
+def extract_from_zip(zip_data: Union[bytes, IO[bytes]], format: str, out: str = 'out') -> List[TestCase]:
+    """
+    :param zip_data: the zip archive, as bytes or as a seekable binary file object (e.g. a temporary file which the archive was streamed to)
+    """
     def iterate():
-        with zipfile.ZipFile(io.BytesIO(zip_data)) as fh:
+        with zipfile.ZipFile(io.BytesIO(zip_data) if isinstance(zip_data, bytes) else zip_data) as fh:
             for filename in fh.namelist():
                 if filename.endswith('/'):  # TODO: use `fh.getinfo(filename).is_dir()` after we stop supporting Python 3.5
                     continue
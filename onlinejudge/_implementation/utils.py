@@ -53,6 +53,9 @@ def next_sibling_tag(tag: bs4.Tag) -> bs4.Tag:
 def new_session_with_our_user_agent() -> requests.Session:
     session = requests.Session()
     session.headers['User-Agent'] += ' (+{})'.format(version.__url__)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
     return session
 
 
@@ -85,6 +88,29 @@ def with_cookiejar(session: requests.Session, path: pathlib.Path = default_cooki
     path.chmod(0o600)  # NOTE: to make secure a little bit
 
 
+_session_pool = {}  # type: Dict[pathlib.Path, requests.Session]
+
+
+@contextlib.contextmanager
+def session(path: pathlib.Path = default_cookie_path) -> Generator[requests.Session, None, None]:
+    """
+    :note: a memoizing variant of :py:func:`with_cookiejar`. The session and its cookiejar are built only once per cookie path, so keep-alive connections and TLS state are reused when commands run twice in the same process. The cookiejar is saved once, when the context exits.
+    """
+    sess = _session_pool.get(path)
+    if sess is None:
+        sess = new_session_with_our_user_agent()
+        sess.cookies = http.cookiejar.LWPCookieJar(str(path))  # type: ignore
+        if path.exists():
+            log.status('load cookie from: %s', path)
+            sess.cookies.load()  # type: ignore
+        _session_pool[path] = sess
+    yield sess
+    log.status('save cookie to: %s', path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sess.cookies.save()  # type: ignore
+    path.chmod(0o600)  # NOTE: to make secure a little bit
+
+
 class FormSender(object):
     def __init__(self, form: bs4.Tag, url: str):
         assert isinstance(form, bs4.Tag)
@@ -240,6 +266,49 @@ def get_latest_version_from_pypi() -> str:
     return value
 
 
+language_cache_path = cache_dir / 'languages.json'
+
+
+def get_cached_available_languages(problem: Problem, *, session: requests.Session, ttl: float = 7 * 24 * 60 * 60) -> List[Language]:
+    """
+    :note: the available languages of a problem change rarely, so they are cached on disk (keyed by the problem URL) to remove one HTTP round-trip from each submit
+    """
+    url = problem.get_url()
+
+    # load cache
+    cache = {}  # type: Dict[str, Any]
+    if language_cache_path.exists():
+        with language_cache_path.open() as fh:
+            cache = json.load(fh)
+    entry = cache.get(url)
+    if entry is not None and time.time() < entry['time'] + ttl:
+        return [Language(LanguageId(language_id), name) for language_id, name in entry['languages']]
+
+    # get
+    languages = problem.get_available_languages(session=session)
+
+    # store cache
+    cache[url] = {
+        'time': int(time.time()),
+        'languages': [[language.id, language.name] for language in languages],
+    }
+    language_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with language_cache_path.open('w') as fh:
+        json.dump(cache, fh)
+
+    return languages
+
+
+def discard_cached_available_languages(problem: Problem) -> None:
+    if not language_cache_path.exists():
+        return
+    with language_cache_path.open() as fh:
+        cache = json.load(fh)
+    if cache.pop(problem.get_url(), None) is not None:
+        with language_cache_path.open('w') as fh:
+            json.dump(cache, fh)
+
+
 def is_update_available_on_pypi() -> bool:
     a = distutils.version.StrictVersion(version.__version__)
     b = distutils.version.StrictVersion(get_latest_version_from_pypi())
@@ -307,11 +376,20 @@ def getter_with_load_details(name: str, type: Union[str, type]) -> Callable:
 
 def snip_large_file_content(content: bytes, limit: int, head: int, tail: int, bold: bool = False) -> str:
     assert head + tail < limit
+    font = log.bold if bold else (lambda s: s)
+
+    # don't decode very large contents; the result is snipped anyway, so decoding only the first chunk is enough for the preview
+    if len(content) >= 64 * 1024:
+        return ''.join([
+            font(content[:4096].decode(errors='replace')),
+            '... ({} bytes truncated)\n'.format(len(content) - 4096),
+        ])
+
     try:
-        text = content.decode()
+        text = content.decode('utf-8')  # this is a single pass; CPython decodes ASCII contents on a fast path
     except UnicodeDecodeError as e:
-        return str(e)
-    font = log.bold if bold else (lambda s: s)
+        # keep the preview of non-UTF-8 contents bounded; repr() of the whole content would be O(n) even for binary blobs
+        return '{} (preview: {})'.format(e, repr(content[:256]))
     char_in_line, _ = shutil.get_terminal_size()
 
     def snip_line_based():
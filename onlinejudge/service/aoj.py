@@ -6,6 +6,7 @@ the module for Aizu Online Judge (http://judge.u-aizu.ac.jp/onlinejudge/)
 :note: There is the offcial API http://developers.u-aizu.ac.jp/index
 """
 
+import concurrent.futures
 import json
 import re
 import string
@@ -62,7 +63,7 @@ class AOJProblem(onlinejudge.type.Problem):
             )]
         return samples
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
         session = session or utils.get_default_session()
 
         # get header
@@ -72,20 +73,25 @@ class AOJProblem(onlinejudge.type.Problem):
         header = json.loads(resp.content.decode(resp.encoding))
 
         # get testcases via the official API
-        testcases = []  # type: List[TestCase]
-        for header in header['headers']:
+        def download_testcase(testcase_header: Dict[str, Any]) -> TestCase:
             # NOTE: the endpoints are not same to http://developers.u-aizu.ac.jp/api?key=judgedat%2Ftestcases%2F%7BproblemId%7D%2F%7Bserial%7D_GET since the json API often says "..... (terminated because of the limitation)"
-            url = 'https://judgedat.u-aizu.ac.jp/testcases/{}/{}'.format(self.problem_id, header['serial'])
+            url = 'https://judgedat.u-aizu.ac.jp/testcases/{}/{}'.format(self.problem_id, testcase_header['serial'])
             resp_in = utils.request('GET', url + '/in', session=session)
             resp_out = utils.request('GET', url + '/out', session=session)
-            testcases += [TestCase(
-                header['name'],
-                header['name'],
+            return TestCase(
+                testcase_header['name'],
+                testcase_header['name'],
                 resp_in.content,
-                header['name'],
+                testcase_header['name'],
                 resp_out.content,
-            )]
-        return testcases
+            )
+
+        if jobs > 1:
+            # the order of the results is preserved by executor.map
+            with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(download_testcase, header['headers']))
+        else:
+            return list(map(download_testcase, header['headers']))
 
     def get_url(self) -> str:
         return 'http://judge.u-aizu.ac.jp/onlinejudge/description.jsp?id={}'.format(self.problem_id)
@@ -155,8 +161,8 @@ class AOJArenaProblem(onlinejudge.type.Problem):
         log.warning("most of problems in arena have no registered sample cases.")
         return AOJProblem(problem_id=self.get_problem_id()).download_sample_cases(session=session)
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
-        return AOJProblem(problem_id=self.get_problem_id()).download_system_cases(session=session)
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
+        return AOJProblem(problem_id=self.get_problem_id()).download_system_cases(session=session, jobs=jobs)
 
     def download_content(self, *, session: Optional[requests.Session] = None):
         """
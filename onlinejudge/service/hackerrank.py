@@ -61,7 +61,10 @@ class HackerRankProblem(onlinejudge.type.Problem):
         log.warning('use --system option')
         raise NotImplementedError
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
+        """
+        :param jobs: unused. the test cases are downloaded as a single zip file
+        """
         session = session or utils.get_default_session()
         # example: https://www.hackerrank.com/rest/contests/hourrank-1/challenges/beautiful-array/download_testcases
         url = 'https://www.hackerrank.com/rest/contests/{}/challenges/{}/download_testcases'.format(self.contest_slug, self.challenge_slug)
@@ -49,7 +49,7 @@ class LibraryCheckerProblem(onlinejudge.type.Problem):
         files += [(file.name, file.read_bytes()) for file in path.glob('out/*.out') if file.name.startswith('example_')]
         return onlinejudge._implementation.testcase_zipper.extract_from_files(iter(files))
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
         self._generate_test_cases_in_cloned_repository()
         path = self._get_problem_directory_path()
         files = []  # type: List[Tuple[str, bytes]]
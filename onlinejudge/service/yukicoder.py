@@ -8,6 +8,7 @@ the module for yukicoder (https://yukicoder.me/)
 
 import json
 import posixpath
+import tempfile
 import urllib.parse
 from typing import *
 
@@ -256,8 +257,9 @@ class YukicoderProblem(onlinejudge.type.Problem):
                 samples.add(data.encode(), name)
         return samples.get()
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
         """
+        :param jobs: unused. the test cases are downloaded as a single zip file
         :raises NotLoggedInError:
         """
 
@@ -265,9 +267,14 @@ class YukicoderProblem(onlinejudge.type.Problem):
         if not self.get_service().is_logged_in(session=session):
             raise NotLoggedInError
         url = 'https://yukicoder.me/problems/no/{}/testcase.zip'.format(self.problem_no)
-        resp = utils.request('GET', url, session=session)
-        fmt = 'test_%e/%s'
-        return onlinejudge._implementation.testcase_zipper.extract_from_zip(resp.content, fmt)
+        # stream the zip file to disk, so that the archive and the extracted test cases are not kept in memory at the same time
+        resp = utils.request('GET', url, session=session, stream=True)
+        with tempfile.TemporaryFile() as fh:
+            for chunk in resp.iter_content(chunk_size=1 << 20):
+                fh.write(chunk)
+            fh.seek(0)
+            fmt = 'test_%e/%s'
+            return onlinejudge._implementation.testcase_zipper.extract_from_zip(fh, fmt)
 
     def _parse_sample_tag(self, tag: bs4.Tag) -> Optional[Tuple[str, str]]:
         assert isinstance(tag, bs4.Tag)
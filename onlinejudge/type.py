@@ -250,8 +250,9 @@ class Problem(ABC):
         """
         raise NotImplementedError
 
-    def download_system_cases(self, *, session: Optional[requests.Session] = None) -> List[TestCase]:
+    def download_system_cases(self, *, session: Optional[requests.Session] = None, jobs: int = 1) -> List[TestCase]:
         """
+        :param jobs: the number of parallel HTTP requests, for services which fetch each test case separately
         :raises NotLoggedInError:
         """
         raise NotImplementedError
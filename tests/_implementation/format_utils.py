@@ -9,6 +9,12 @@ class PercentFormatTest(unittest.TestCase):
         self.assertEqual(percentformat("foo %%a bar %%%a %b", {"a": "%a%b", "b": "12345"}), 'foo %a bar %%a%b 12345')
         self.assertRaises(KeyError, lambda: percentformat("%z", {}))
 
+    def test_compile_percentformat(self):
+        render = compile_percentformat("foo %a%a bar %b")
+        self.assertEqual(render({"a": "AA", "b": "12345"}), 'foo AAAA bar 12345')
+        self.assertEqual(render({"a": "%a%b", "b": "12345"}), 'foo %a%b%a%b bar 12345')
+        self.assertRaises(KeyError, lambda: compile_percentformat("%z")({}))
+
     def test_percentparse(self):
         self.assertEqual(percentparse("foo AAAA bar 12345", "foo %a%a bar %b", {"a": "AA", "b": "12345"}), {'a': 'AA', 'b': '12345'})
         self.assertEqual(percentparse("123456789", "%x%y%z", {"x": r"\d+", "y": r"\d", "z": r"(\d\d\d)+"}), {'x': '12345', 'y': '6', 'z': '789'})
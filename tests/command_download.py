@@ -19,7 +19,7 @@ def get_files_from_json(samples):
     return files
 
 
-def snippet_call_download(self, url, files, is_system=False, is_silent=False, type='files'):
+def snippet_call_download(self, url, files, is_system=False, is_silent=False, jobs=None, type='files'):
     assert type in 'files' or 'json'
     if type == 'json':
         files = get_files_from_json(files)
@@ -30,6 +30,8 @@ def snippet_call_download(self, url, files, is_system=False, is_silent=False, ty
             args += ['--system']
         if is_silent:
             args += ['--silent']
+        if jobs is not None:
+            args += ['--jobs', str(jobs)]
         tests.utils.run(args, check=True)
         result = {}
         if os.path.exists('test'):
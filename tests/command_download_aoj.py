@@ -55,7 +55,7 @@ class DownloadAOJTest(unittest.TestCase):
             'test3.out': 'fef5f767008b27f5c3801382264f46ef',
             'test4.in': '919d117956d3135c4c683ff021352f5c',
             'test4.out': 'b39ffd5aa5029d696193c8362dcb1d19',
-        }, is_system=True)
+        }, is_system=True, jobs=2)
 
     def test_call_download_aoj_system_1169(self):
         self.snippet_call_download('http://judge.u-aizu.ac.jp/onlinejudge/description.jsp?id=1169&lang=jp', {
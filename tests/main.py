@@ -0,0 +1,29 @@
+import unittest
+
+import tests.utils
+
+from onlinejudge._implementation.main import get_parser, subcommand_aliases
+
+
+class SubcommandValidationTest(unittest.TestCase):
+    def test_subcommand_aliases(self):
+        for alias in ('download', 'd', 'dl', 'login', 'l', 'submit', 's', 'test', 't', 'generate-output', 'g/o', 'generate-input', 'g/i', 'split-input', 'test-reactive', 't/r'):
+            self.assertIn(alias, subcommand_aliases)
+
+    def test_unknown_subcommand(self):
+        proc = tests.utils.run(['frobnicate'])
+        self.assertNotEqual(proc.returncode, 0)
+
+    def test_no_subcommand(self):
+        proc = tests.utils.run([])
+        self.assertEqual(proc.returncode, 1)
+
+    def test_lazily_built_parser(self):
+        args = get_parser('t').parse_args(['t', '--json'])
+        self.assertEqual(args.subcommand, 't')
+        self.assertTrue(args.json)
+
+    def test_fully_built_parser(self):
+        args = get_parser().parse_args(['dl', 'http://example.com/'])
+        self.assertEqual(args.subcommand, 'dl')
+        self.assertEqual(args.url, 'http://example.com/')